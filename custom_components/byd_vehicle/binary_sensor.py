@@ -21,7 +21,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN
 from .coordinator import (
     BydDataUpdateCoordinator,
-    get_vehicle_display,
 )
 
 
@@ -308,8 +307,10 @@ async def async_setup_entry(
         vehicle = coordinator.data.get("vehicles", {}).get(vin)
         if vehicle is None:
             continue
-        for description in BINARY_SENSOR_DESCRIPTIONS:
-            entities.append(BydBinarySensor(coordinator, vin, vehicle, description))
+        entities.extend(
+            BydBinarySensor(coordinator, vin, vehicle, description)
+            for description in BINARY_SENSOR_DESCRIPTIONS
+        )
 
     async_add_entities(entities)
 
@@ -334,6 +335,14 @@ class BydBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._vin = vin
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_{description.source}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, vin)},
+            name=coordinator.vehicle_display,
+            manufacturer=getattr(vehicle, "brand_name", None) or "BYD",
+            model=getattr(vehicle, "model_name", None),
+            serial_number=vin,
+            hw_version=getattr(vehicle, "tbox_version", None) or None,
+        )
 
         # Auto-disable binary sensors that return no data on first fetch.
         if description.entity_registry_enabled_default is not False:
@@ -346,8 +355,7 @@ class BydBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     def _get_source_obj(self) -> Any | None:
         """Return the model object for this sensor's source."""
-        source_map = self.coordinator.data.get(self.entity_description.source, {})
-        return source_map.get(self._vin)
+        return self.coordinator.get_source_obj(self.entity_description.source)
 
     def _resolve_value(self) -> bool | None:
         """Extract the current value using the description's extraction logic."""
@@ -375,15 +383,3 @@ class BydBinarySensor(CoordinatorEntity, BinarySensorEntity):
     def is_on(self) -> bool | None:
         """Return the binary sensor state."""
         return self._resolve_value()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this binary sensor."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._vin)},
-            name=get_vehicle_display(self._vehicle),
-            manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
-            model=getattr(self._vehicle, "model_name", None),
-            serial_number=self._vin,
-            hw_version=getattr(self._vehicle, "tbox_version", None) or None,
-        )
@@ -16,7 +16,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from pybyd import BydRemoteControlError
 
 from .const import DOMAIN
-from .coordinator import BydApi, BydDataUpdateCoordinator, get_vehicle_display
+from .coordinator import BydApi, BydDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +93,15 @@ class BydButton(CoordinatorEntity, ButtonEntity):
         self._vin = vin
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_button_{description.key}"
+        self._static_attrs: dict[str, Any] = {"vin": vin}
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, vin)},
+            name=coordinator.vehicle_display,
+            manufacturer=getattr(vehicle, "brand_name", None) or "BYD",
+            model=getattr(vehicle, "model_name", None),
+            serial_number=vin,
+            hw_version=getattr(vehicle, "tbox_version", None) or None,
+        )
 
     @property
     def available(self) -> bool:
@@ -132,22 +141,9 @@ class BydButton(CoordinatorEntity, ButtonEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        attrs: dict[str, Any] = {"vin": self._vin}
         last_result = self._api.get_last_remote_result(
             self._vin, self.entity_description.method
         )
-        if last_result:
-            attrs["last_remote_result"] = last_result
-        return attrs
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this button."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._vin)},
-            name=get_vehicle_display(self._vehicle),
-            manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
-            model=getattr(self._vehicle, "model_name", None),
-            serial_number=self._vin,
-            hw_version=getattr(self._vehicle, "tbox_version", None) or None,
-        )
+        if not last_result:
+            return self._static_attrs
+        return {**self._static_attrs, "last_remote_result": last_result}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import logging
 from typing import Any
 
@@ -15,14 +16,44 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from pybyd import BydRemoteControlError
+from pybyd.models import hvac as hvac_models
 from pybyd.models.hvac import HvacStatus
 
 from .const import CONF_CLIMATE_DURATION, DEFAULT_CLIMATE_DURATION, DOMAIN
-from .coordinator import BydApi, BydDataUpdateCoordinator, get_vehicle_display
+from .coordinator import BydApi, BydDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Field updates that make HvacStatus.is_ac_on report on/off. Up to pybyd
+# 0.0.30 is_ac_on reads plain ints (a remote start reports status=2). Later
+# releases type status as HvacOverallStatus and only status is patched:
+# 0.0.35 marks a running A/C as ACTIVE, 0.0.45+ use ON/OFF.
+_HvacOverallStatus: Any = getattr(hvac_models, "HvacOverallStatus", None)
+if _HvacOverallStatus is None:
+    _HVAC_ON_CHANGES: dict[str, Any] = {"ac_switch": 1, "status": 2}
+    _HVAC_OFF_CHANGES: dict[str, Any] = {"ac_switch": 0, "status": 0}
+else:
+    _HVAC_ON_CHANGES = {
+        "status": getattr(_HvacOverallStatus, "ON", None) or _HvacOverallStatus.ACTIVE
+    }
+    _HVAC_OFF_CHANGES = {
+        "status": getattr(_HvacOverallStatus, "OFF", _HvacOverallStatus.UNKNOWN)
+    }
+
+
+def _copy_hvac(hvac: Any, changes: dict[str, Any]) -> Any:
+    """Return a copy of a frozen ``HvacStatus`` with *changes* applied.
+
+    pybyd 0.0.29 models are dataclasses; later releases are frozen
+    pydantic models.
+    """
+    model_copy = getattr(hvac, "model_copy", None)
+    if model_copy is not None:
+        return model_copy(update=changes)
+    return dataclasses.replace(hvac, **changes)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -88,14 +119,28 @@ class BydClimate(CoordinatorEntity, ClimateEntity):
         self._vehicle = vehicle
         self._climate_duration = climate_duration
         self._attr_unique_id = f"{vin}_climate"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, vin)},
+            name=coordinator.vehicle_display,
+            manufacturer=getattr(vehicle, "brand_name", None) or "BYD",
+            model=getattr(vehicle, "model_name", None),
+            serial_number=vin,
+            hw_version=getattr(vehicle, "tbox_version", None) or None,
+        )
         self._last_mode = HVACMode.OFF
         self._last_command: str | None = None
         self._pending_target_temp: float | None = None
         self._command_pending = False
+        self._static_attrs: dict[str, Any] = {"vin": vin}
+        # HVAC-derived attributes, rebuilt only when the coordinator hands
+        # out a different HvacStatus object.
+        self._hvac_attrs_cache: tuple[HvacStatus | None, dict[str, Any]] = (
+            None,
+            self._static_attrs,
+        )
 
     def _get_hvac_status(self) -> HvacStatus | None:
-        hvac_map = self.coordinator.data.get("hvac", {})
-        hvac = hvac_map.get(self._vin)
+        hvac = self.coordinator.get_source_obj("hvac")
         if isinstance(hvac, HvacStatus):
             return hvac
         return None
@@ -135,6 +180,32 @@ class BydClimate(CoordinatorEntity, ClimateEntity):
             return scale_value
         return None
 
+    def _apply_optimistic_state(self, *, on: bool, temp_c: float | None) -> bool:
+        """Patch the cached HVAC status with the commanded state.
+
+        The patched copy is pushed through the coordinator so every listener
+        on this VIN (e.g. the car-on switch) reflects the command until the
+        next poll replaces it. Returns False when there is nothing to patch.
+        """
+        hvac = self._get_hvac_status()
+        if hvac is None:
+            return False
+        changes = dict(_HVAC_ON_CHANGES if on else _HVAC_OFF_CHANGES)
+        if on and temp_c is not None:
+            changes["main_setting_temp_new"] = temp_c
+        patched = _copy_hvac(hvac, changes)
+        if patched.is_ac_on != on:
+            # Unknown field mapping in this pybyd release; keep it local.
+            return False
+        self.coordinator.async_set_optimistic_hvac(patched)
+        return True
+
+    def _write_local_mode(self) -> None:
+        """Show ``_last_mode`` on this entity only until the next refresh."""
+        self._command_pending = True
+        self.coordinator.async_notify_next_refresh()
+        self.async_write_ha_state()
+
     @property
     def available(self) -> bool:
         """Available when coordinator has data for this vehicle."""
@@ -146,7 +217,7 @@ class BydClimate(CoordinatorEntity, ClimateEntity):
 
     @property
     def hvac_mode(self) -> HVACMode:
-        # After a command, prefer optimistic state until coordinator refreshes
+        # Without HVAC data to patch, show the commanded mode until a refresh
         if self._command_pending:
             return self._last_mode
         hvac = self._get_hvac_status()
@@ -164,8 +235,7 @@ class BydClimate(CoordinatorEntity, ClimateEntity):
         if hvac is not None and hvac.interior_temp_available:
             return hvac.temp_in_car
         # Fall back to realtime data
-        realtime_map = self.coordinator.data.get("realtime", {})
-        realtime = realtime_map.get(self._vin)
+        realtime = self.coordinator.get_source_obj("realtime")
         if realtime is not None:
             temp = getattr(realtime, "temp_in_car", None)
             if temp is not None and temp != -129:
@@ -203,12 +273,14 @@ class BydClimate(CoordinatorEntity, ClimateEntity):
             kwargs["time_span"] = self._climate_duration
             return await client.start_climate(self._vin, **kwargs)
 
+        cloud_failed = False
         try:
             self._last_command = (
                 "stop_climate" if hvac_mode == HVACMode.OFF else "start_climate"
             )
             await self._api.async_call(_call, vin=self._vin, command=self._last_command)
         except BydRemoteControlError as exc:
+            cloud_failed = True
             _LOGGER.warning(
                 "Climate %s command sent but cloud reported failure — "
                 "updating state optimistically: %s",
@@ -219,8 +291,11 @@ class BydClimate(CoordinatorEntity, ClimateEntity):
             raise HomeAssistantError(str(exc)) from exc
 
         self._last_mode = hvac_mode
-        self._command_pending = True
-        self.async_write_ha_state()
+        on = hvac_mode != HVACMode.OFF
+        temp_c = self._scale_to_celsius(self._celsius_to_scale(temp)) if on else None
+        # Only publish to the coordinator when the cloud accepted the command
+        if cloud_failed or not self._apply_optimistic_state(on=on, temp_c=temp_c):
+            self._write_local_mode()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set target temperature."""
@@ -252,7 +327,7 @@ class BydClimate(CoordinatorEntity, ClimateEntity):
             except Exception as exc:  # noqa: BLE001
                 raise HomeAssistantError(str(exc)) from exc
 
-        self._command_pending = True
+        self.coordinator.async_notify_next_refresh()
         self.async_write_ha_state()
 
     @property
@@ -284,10 +359,12 @@ class BydClimate(CoordinatorEntity, ClimateEntity):
                 self._vin, temperature=scale, time_span=self._climate_duration
             )
 
+        cloud_failed = False
         try:
             self._last_command = "start_climate"
             await self._api.async_call(_call, vin=self._vin, command=self._last_command)
         except BydRemoteControlError as exc:
+            cloud_failed = True
             _LOGGER.warning(
                 "Climate preset command sent but cloud reported failure — "
                 "updating state optimistically: %s",
@@ -297,8 +374,10 @@ class BydClimate(CoordinatorEntity, ClimateEntity):
             raise HomeAssistantError(str(exc)) from exc
 
         self._last_mode = HVACMode.HEAT_COOL
-        self._command_pending = True
-        self.async_write_ha_state()
+        if cloud_failed or not self._apply_optimistic_state(
+            on=True, temp_c=self._scale_to_celsius(scale)
+        ):
+            self._write_local_mode()
 
     def _handle_coordinator_update(self) -> None:
         """Clear optimistic state when fresh data arrives from the coordinator."""
@@ -306,54 +385,51 @@ class BydClimate(CoordinatorEntity, ClimateEntity):
         self._pending_target_temp = None
         super()._handle_coordinator_update()
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        attrs: dict[str, Any] = {"vin": self._vin}
-        hvac = self._get_hvac_status()
-        if hvac is not None:
-            # Temperatures
-            attrs["exterior_temperature"] = hvac.temp_out_car
-            # copilot_setting_temp_new is already in °C;
-            # copilot_setting_temp is a BYD scale value (1-17)
-            attrs["passenger_set_temperature"] = (
-                hvac.copilot_setting_temp_new
-                if hvac.copilot_setting_temp_new is not None
-                else (
-                    self._scale_to_celsius(hvac.copilot_setting_temp)
-                    if hvac.copilot_setting_temp is not None
-                    else None
-                )
-            )
-            # Airflow
-            attrs["fan_speed"] = hvac.wind_mode
-            attrs["airflow_direction"] = hvac.wind_position
-            attrs["recirculation"] = hvac.cycle_choice
-            # Defrost / deicing
-            attrs["front_defrost"] = hvac.front_defrost_status
-            attrs["rear_defrost"] = hvac.electric_defrost_status
-            attrs["wiper_heat"] = hvac.wiper_heat_status
-            # Air quality
-            attrs["pm25"] = hvac.pm
-            attrs["pm25_exterior_state"] = hvac.pm25_state_out_car
-            # Misc
-            attrs["rapid_heating"] = hvac.rapid_increase_temp_state
-            attrs["rapid_cooling"] = hvac.rapid_decrease_temp_state
-        if self._last_command:
-            attrs["last_remote_command"] = self._last_command
-            last_result = self._api.get_last_remote_result(
-                self._vin, self._last_command
+    def _build_hvac_attrs(self, hvac: HvacStatus | None) -> dict[str, Any]:
+        """Build state attributes derived from an HVAC status snapshot."""
+        if hvac is None:
+            return self._static_attrs
+        attrs: dict[str, Any] = dict(self._static_attrs)
+        # Temperatures
+        attrs["exterior_temperature"] = hvac.temp_out_car
+        # copilot_setting_temp_new is already in °C;
+        # copilot_setting_temp is a BYD scale value (1-17)
+        attrs["passenger_set_temperature"] = (
+            hvac.copilot_setting_temp_new
+            if hvac.copilot_setting_temp_new is not None
+            else (
+                self._scale_to_celsius(hvac.copilot_setting_temp)
+                if hvac.copilot_setting_temp is not None
+                else None
             )
-            if last_result:
-                attrs["last_remote_result"] = last_result
+        )
+        # Airflow
+        attrs["fan_speed"] = hvac.wind_mode
+        attrs["airflow_direction"] = hvac.wind_position
+        attrs["recirculation"] = hvac.cycle_choice
+        # Defrost / deicing
+        attrs["front_defrost"] = hvac.front_defrost_status
+        attrs["rear_defrost"] = hvac.electric_defrost_status
+        attrs["wiper_heat"] = hvac.wiper_heat_status
+        # Air quality
+        attrs["pm25"] = hvac.pm
+        attrs["pm25_exterior_state"] = hvac.pm25_state_out_car
+        # Misc
+        attrs["rapid_heating"] = hvac.rapid_increase_temp_state
+        attrs["rapid_cooling"] = hvac.rapid_decrease_temp_state
         return attrs
 
     @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._vin)},
-            name=get_vehicle_display(self._vehicle),
-            manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
-            model=getattr(self._vehicle, "model_name", None),
-            serial_number=self._vin,
-            hw_version=getattr(self._vehicle, "tbox_version", None) or None,
-        )
+    def extra_state_attributes(self) -> dict[str, Any]:
+        hvac = self._get_hvac_status()
+        cached_hvac, attrs = self._hvac_attrs_cache
+        if hvac is not cached_hvac:
+            attrs = self._build_hvac_attrs(hvac)
+            self._hvac_attrs_cache = (hvac, attrs)
+        if not self._last_command:
+            return attrs
+        attrs = {**attrs, "last_remote_command": self._last_command}
+        last_result = self._api.get_last_remote_result(self._vin, self._last_command)
+        if last_result:
+            attrs["last_remote_result"] = last_result
+        return attrs
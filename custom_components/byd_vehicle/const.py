@@ -51,6 +51,9 @@ MAX_GPS_INACTIVE_INTERVAL = 3600
 MIN_CLIMATE_DURATION = 1
 MAX_CLIMATE_DURATION = 60
 
+# Minimum seconds between remote commands sent to the BYD cloud for one account.
+REMOTE_COMMAND_MIN_INTERVAL = 2.0
+
 # https://github.com/jkaberg/hass-byd-vehicle/issues/12
 BASE_URLS: dict[str, str] = {
     "Europe": "https://dilinkappoversea-eu.byd.auto",
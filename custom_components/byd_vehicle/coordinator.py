@@ -8,11 +8,11 @@ import json
 import logging
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from time import perf_counter
+from time import monotonic, perf_counter
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from pybyd import (
@@ -41,6 +41,7 @@ from .const import (
     DEFAULT_DEBUG_DUMPS,
     DEFAULT_LANGUAGE,
     DOMAIN,
+    REMOTE_COMMAND_MIN_INTERVAL,
 )
 from .freshness import build_telemetry_material_snapshot, snapshot_digest
 
@@ -107,6 +108,9 @@ class BydApi:
         # Serialize all BYD cloud calls so telemetry polls and remote
         # commands never overlap (BYD returns 6024 for concurrent ops).
         self._api_lock = asyncio.Lock()
+        # Monotonic time the last remote command finished, used to pace
+        # bursts (e.g. from automations) before BYD answers with 6024.
+        self._last_command_at: float | None = None
         _LOGGER.debug(
             "BYD API initialized: entry_id=%s, region=%s, language=%s",
             entry.entry_id,
@@ -307,6 +311,16 @@ class BydApi:
     def get_last_remote_result(self, vin: str, command: str) -> dict[str, Any] | None:
         return self._last_remote_results.get((vin, command))
 
+    def get_first_remote_result(
+        self, vin: str, commands: tuple[str, ...]
+    ) -> dict[str, Any] | None:
+        """Return the stored result of the first of *commands* that has one."""
+        for command in commands:
+            result = self._last_remote_results.get((vin, command))
+            if result:
+                return result
+        return None
+
     @staticmethod
     def _related_command_names(command: str) -> set[str]:
         related = {command}
@@ -330,6 +344,10 @@ class BydApi:
     def is_remote_command_supported(self, vin: str, command: str) -> bool:
         return command not in self._unsupported_remote_commands.get(vin, set())
 
+    def unsupported_remote_command_count(self, vin: str) -> int:
+        """Return how many remote commands are marked unsupported for a VIN."""
+        return len(self._unsupported_remote_commands.get(vin, ()))
+
     def _store_remote_result(
         self,
         vin: str,
@@ -406,6 +424,9 @@ class BydApi:
         All calls are serialized through ``_api_lock`` so that
         telemetry polls and remote-control commands never overlap on
         BYD's cloud (which returns code 6024 for concurrent ops).
+        Remote commands are additionally spaced at least
+        ``REMOTE_COMMAND_MIN_INTERVAL`` seconds apart; that wait happens
+        before the lock is taken, so polls are not delayed by it.
 
         The pybyd client handles login and session-expiry retries
         internally via ``ensure_session()``.  We only need to recreate
@@ -418,29 +439,59 @@ class BydApi:
             vin[-6:] if vin else "-",
             command or "-",
         )
-        async with self._api_lock:
-            try:
-                result = await self._async_call_inner(handler, vin=vin, command=command)
-                _LOGGER.debug(
-                    "BYD API call succeeded: entry_id=%s, vin=%s, command=%s, "
-                    "duration_ms=%.1f",
-                    self._entry.entry_id,
-                    vin[-6:] if vin else "-",
-                    command or "-",
-                    (perf_counter() - call_started) * 1000,
-                )
-                return result
-            except Exception as exc:  # noqa: BLE001
-                _LOGGER.debug(
-                    "BYD API call failed: entry_id=%s, vin=%s, command=%s, "
-                    "duration_ms=%.1f, error=%s",
-                    self._entry.entry_id,
-                    vin[-6:] if vin else "-",
-                    command or "-",
-                    (perf_counter() - call_started) * 1000,
-                    type(exc).__name__,
-                )
-                raise
+        if command is None:
+            await self._api_lock.acquire()
+        else:
+            await self._async_acquire_lock_for_command()
+        try:
+            result = await self._async_call_inner(handler, vin=vin, command=command)
+            _LOGGER.debug(
+                "BYD API call succeeded: entry_id=%s, vin=%s, command=%s, "
+                "duration_ms=%.1f",
+                self._entry.entry_id,
+                vin[-6:] if vin else "-",
+                command or "-",
+                (perf_counter() - call_started) * 1000,
+            )
+            return result
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.debug(
+                "BYD API call failed: entry_id=%s, vin=%s, command=%s, "
+                "duration_ms=%.1f, error=%s",
+                self._entry.entry_id,
+                vin[-6:] if vin else "-",
+                command or "-",
+                (perf_counter() - call_started) * 1000,
+                type(exc).__name__,
+            )
+            raise
+        finally:
+            if command is not None:
+                self._last_command_at = monotonic()
+            self._api_lock.release()
+
+    async def _async_acquire_lock_for_command(self) -> None:
+        """Acquire ``_api_lock`` once the minimum command gap has passed.
+
+        The wait happens before taking the lock so telemetry polls are not
+        held up by it. The gap is re-checked once the lock is held, since
+        another command may have run in the meantime.
+        """
+        while True:
+            delay = self._command_delay()
+            if delay > 0:
+                _LOGGER.debug("Pacing BYD remote command for %.1fs", delay)
+                await asyncio.sleep(delay)
+            await self._api_lock.acquire()
+            if self._command_delay() <= 0:
+                return
+            self._api_lock.release()
+
+    def _command_delay(self) -> float:
+        """Return seconds left before the next remote command may be sent."""
+        if self._last_command_at is None:
+            return 0.0
+        return REMOTE_COMMAND_MIN_INTERVAL - (monotonic() - self._last_command_at)
 
     async def _async_call_inner(
         self,
@@ -518,7 +569,17 @@ class BydApi:
 
 
 class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator for telemetry updates for a single VIN."""
+    """Coordinator for telemetry updates for a single VIN.
+
+    Listeners are only called when ``data`` changes (``always_update`` is
+    off). Entities that keep local optimistic state after a command must
+    call ``async_notify_next_refresh()`` when they set it, otherwise an
+    unchanged poll never clears it. That call turns ``always_update`` on
+    until listeners next run. Values entities read from ``BydApi`` rather
+    than ``data`` must be included in ``_api_state()``.
+    """
+
+    data: dict[str, Any]
 
     def __init__(
         self,
@@ -536,13 +597,74 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=f"{DOMAIN}_telemetry_{vin[-6:]}",
             update_interval=timedelta(seconds=poll_interval),
+            # pybyd models compare by value, so unchanged polls (including
+            # skipped ones returning self.data) don't fan out to entities.
+            # async_notify_next_refresh() re-enables one notification for
+            # state that lives outside self.data.
+            always_update=False,
         )
         self._api = api
         self._vehicle = vehicle
         self._vin = vin
+        # Shared by every entity of this VIN for its device name.
+        self.vehicle_display = get_vehicle_display(vehicle)
         self._active_interval = timedelta(seconds=active_interval)
         self._inactive_interval = timedelta(seconds=inactive_interval)
         self._current_interval = timedelta(seconds=poll_interval)
+        self._hvac_refetch = False
+        self._notified_api_state = self._api_state()
+
+    def get_source_obj(self, source: str) -> Any | None:
+        """Return this VIN's model object for a data source (e.g. ``hvac``)."""
+        return self.data.get(source, {}).get(self._vin)
+
+    def async_set_optimistic_hvac(self, hvac: Any) -> None:
+        """Publish a locally patched HVAC status to all listeners.
+
+        The refresh timer is left alone so the next poll still confirms or
+        reverts the command on schedule, and that poll always re-fetches
+        HVAC so the patch is never carried forward as cached data.
+        """
+        self._hvac_refetch = True
+        data = self.data
+        self.data = {**data, "hvac": {**data.get("hvac", {}), self._vin: hvac}}
+        self.async_update_listeners()
+        # Make sure the next poll reverts the patch even if nothing changed.
+        self.async_notify_next_refresh()
+
+    @callback
+    def async_notify_next_refresh(self) -> None:
+        """Call listeners after the next refresh even if data is unchanged.
+
+        Entities holding optimistic state after a command rely on the next
+        refresh to fall back to the reported values.
+        """
+        self.always_update = True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, then go back to change-only updates."""
+        self.always_update = False
+        self._notified_api_state = self._api_state()
+        super().async_update_listeners()
+
+    def _api_state(self) -> tuple[Any, ...]:
+        """Return the BydApi-held values entities read besides self.data."""
+        return (
+            self._api.get_telemetry_last_received(self._vin),
+            self._api.get_gps_freshness(self._vin),
+            self._api.unsupported_remote_command_count(self._vin),
+        )
+
+    def _notify_on_api_state_change(self) -> None:
+        """Notify on this refresh when BydApi-held values moved.
+
+        GPS freshness is advanced by the GPS coordinator and unsupported
+        commands are marked by entity calls, neither of which changes
+        self.data.
+        """
+        if self._api_state() != self._notified_api_state:
+            self.async_notify_next_refresh()
 
     def _desired_interval(self) -> timedelta:
         """Determine telemetry polling interval from freshness recency."""
@@ -620,10 +742,11 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def _should_fetch_hvac_status(self, realtime: Any | None) -> bool:
         """Return True when HVAC status should be fetched.
 
-        Always fetch once during startup to establish initial HVAC state.
-        After that, fetch only while vehicle state is ON.
+        Always fetch once during startup to establish initial HVAC state,
+        and after an optimistic update. Otherwise fetch only while vehicle
+        state is ON.
         """
-        if not isinstance(self.data, dict):
+        if not isinstance(self.data, dict) or self._hvac_refetch:
             return True
 
         previous_hvac = self.data.get("hvac", {}).get(self._vin)
@@ -705,6 +828,7 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 round(age, 1) if age is not None else None,
                 self._current_interval.total_seconds(),
             )
+            self._notify_on_api_state_change()
             return self.data
 
         async def _fetch(client: BydClient) -> dict[str, Any]:
@@ -744,6 +868,7 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if self._should_fetch_hvac_status(realtime):
                 try:
                     hvac = await client.get_hvac_status(self._vin)
+                    self._hvac_refetch = False
                 except auth_errors:
                     raise
                 except recoverable_errors as exc:
@@ -822,22 +947,26 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             }
 
         data = await self._api.async_call(_fetch)
+        realtime = data.get("realtime", {}).get(self._vin)
+        energy = data.get("energy", {}).get(self._vin)
+        hvac = data.get("hvac", {}).get(self._vin)
+        charging = data.get("charging", {}).get(self._vin)
         self._api.update_last_transmission(
             self._vin,
-            realtime=data.get("realtime", {}).get(self._vin),
-            charging=data.get("charging", {}).get(self._vin),
+            realtime=realtime,
+            charging=charging,
         )
         self._api.update_telemetry_last_received(
             self._vin,
-            realtime=data.get("realtime", {}).get(self._vin),
-            charging=data.get("charging", {}).get(self._vin),
+            realtime=realtime,
+            charging=charging,
         )
         freshness_updated = self._api.update_telemetry_freshness(
             self._vin,
-            realtime=data.get("realtime", {}).get(self._vin),
-            hvac=data.get("hvac", {}).get(self._vin),
-            charging=data.get("charging", {}).get(self._vin),
-            energy=data.get("energy", {}).get(self._vin),
+            realtime=realtime,
+            hvac=hvac,
+            charging=charging,
+            energy=energy,
         )
         self._adjust_interval()
         if freshness_updated:
@@ -846,11 +975,12 @@ class BydDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "Telemetry refresh succeeded: vin=%s, realtime=%s, "
             "energy=%s, hvac=%s, charging=%s",
             self._vin[-6:],
-            self._vin in data.get("realtime", {}),
-            self._vin in data.get("energy", {}),
-            self._vin in data.get("hvac", {}),
-            self._vin in data.get("charging", {}),
+            realtime is not None,
+            energy is not None,
+            hvac is not None,
+            charging is not None,
         )
+        self._notify_on_api_state_change()
         return data
 
 
@@ -875,10 +1005,12 @@ class BydGpsUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=f"{DOMAIN}_gps_{vin[-6:]}",
             update_interval=timedelta(seconds=poll_interval),
+            always_update=False,
         )
         self._api = api
         self._vehicle = vehicle
         self._vin = vin
+        self.vehicle_display = get_vehicle_display(vehicle)
         self._telemetry_coordinator = telemetry_coordinator
         self._smart_polling = smart_polling
         self._fixed_interval = timedelta(seconds=poll_interval)
@@ -1017,19 +1149,14 @@ class BydGpsUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             }
 
         data = await self._api.async_call(_fetch)
-        self._api.update_last_transmission(
-            self._vin,
-            gps=data.get("gps", {}).get(self._vin),
-        )
-        self._api.update_gps_freshness(
-            self._vin,
-            gps=data.get("gps", {}).get(self._vin),
-        )
+        gps = data.get("gps", {}).get(self._vin)
+        self._api.update_last_transmission(self._vin, gps=gps)
+        self._api.update_gps_freshness(self._vin, gps=gps)
         self._adjust_interval(data)
         _LOGGER.debug(
             "GPS refresh succeeded: vin=%s, gps=%s, smart_polling=%s, moving=%s",
             self._vin[-6:],
-            self._vin in data.get("gps", {}),
+            gps is not None,
             self._smart_polling,
             self._last_smart_state,
         )
@@ -12,7 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import BydGpsUpdateCoordinator, get_vehicle_display
+from .coordinator import BydGpsUpdateCoordinator
 
 
 async def async_setup_entry(
@@ -47,6 +47,14 @@ class BydDeviceTracker(CoordinatorEntity, TrackerEntity):
         self._vin = vin
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_tracker"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, vin)},
+            name=coordinator.vehicle_display,
+            manufacturer=getattr(vehicle, "brand_name", None) or "BYD",
+            model=getattr(vehicle, "model_name", None),
+            serial_number=vin,
+            hw_version=getattr(vehicle, "tbox_version", None) or None,
+        )
 
     @property
     def available(self) -> bool:
@@ -78,14 +86,3 @@ class BydDeviceTracker(CoordinatorEntity, TrackerEntity):
             "gps_direction": getattr(gps, "direction", None) if gps else None,
             "gps_timestamp": getattr(gps, "gps_timestamp", None) if gps else None,
         }
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._vin)},
-            name=get_vehicle_display(self._vehicle),
-            manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
-            model=getattr(self._vehicle, "model_name", None),
-            serial_number=self._vin,
-            hw_version=getattr(self._vehicle, "tbox_version", None) or None,
-        )
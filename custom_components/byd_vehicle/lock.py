@@ -16,7 +16,7 @@ from pybyd import BydRemoteControlError
 from pybyd.models.realtime import LockState
 
 from .const import DOMAIN
-from .coordinator import BydApi, BydDataUpdateCoordinator, get_vehicle_display
+from .coordinator import BydApi, BydDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -59,6 +59,14 @@ class BydLock(CoordinatorEntity, LockEntity):
         self._vin = vin
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_lock"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, vin)},
+            name=coordinator.vehicle_display,
+            manufacturer=getattr(vehicle, "brand_name", None) or "BYD",
+            model=getattr(vehicle, "model_name", None),
+            serial_number=vin,
+            hw_version=getattr(vehicle, "tbox_version", None) or None,
+        )
         self._last_command: str | None = None
         self._last_locked: bool | None = None
         self._command_pending = False
@@ -73,8 +81,7 @@ class BydLock(CoordinatorEntity, LockEntity):
         return self._api.is_remote_command_supported(self._vin, "lock")
 
     def _get_realtime_locks(self) -> list[bool] | None:
-        realtime_map = self.coordinator.data.get("realtime", {})
-        realtime = realtime_map.get(self._vin)
+        realtime = self.coordinator.get_source_obj("realtime")
         if realtime is None:
             return None
 
@@ -125,6 +132,7 @@ class BydLock(CoordinatorEntity, LockEntity):
             self._last_locked = None
             raise HomeAssistantError(str(exc)) from exc
         self._command_pending = True
+        self.coordinator.async_notify_next_refresh()
         self.async_write_ha_state()
 
     async def async_unlock(self, **_: Any) -> None:
@@ -145,6 +153,7 @@ class BydLock(CoordinatorEntity, LockEntity):
             self._last_locked = None
             raise HomeAssistantError(str(exc)) from exc
         self._command_pending = True
+        self.coordinator.async_notify_next_refresh()
         self.async_write_ha_state()
 
     def _handle_coordinator_update(self) -> None:
@@ -163,14 +172,3 @@ class BydLock(CoordinatorEntity, LockEntity):
             if last_result:
                 attrs["last_remote_result"] = last_result
         return attrs
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._vin)},
-            name=get_vehicle_display(self._vehicle),
-            manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
-            model=getattr(self._vehicle, "model_name", None),
-            serial_number=self._vin,
-            hw_version=getattr(self._vehicle, "tbox_version", None) or None,
-        )
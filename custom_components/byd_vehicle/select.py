@@ -17,7 +17,7 @@ from pybyd import BydRemoteControlError
 from pybyd.models.hvac import HvacStatus
 
 from .const import DOMAIN
-from .coordinator import BydApi, BydDataUpdateCoordinator, get_vehicle_display
+from .coordinator import BydApi, BydDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -222,6 +222,16 @@ class BydSeatClimateSelect(CoordinatorEntity, SelectEntity):
         self._vin = vin
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_select_{description.key}"
+        self._command = f"seat_climate_{description.key}"
+        self._static_attrs: dict[str, Any] = {"vin": vin}
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, vin)},
+            name=coordinator.vehicle_display,
+            manufacturer=getattr(vehicle, "brand_name", None) or "BYD",
+            model=getattr(vehicle, "model_name", None),
+            serial_number=vin,
+            hw_version=getattr(vehicle, "tbox_version", None) or None,
+        )
         self._pending_value: str | None = None
         self._command_pending = False
 
@@ -230,12 +240,11 @@ class BydSeatClimateSelect(CoordinatorEntity, SelectEntity):
                 self._attr_entity_registry_enabled_default = False
 
     def _get_hvac_status(self) -> HvacStatus | None:
-        hvac_map = self.coordinator.data.get("hvac", {})
-        hvac = hvac_map.get(self._vin)
+        hvac = self.coordinator.get_source_obj("hvac")
         return hvac if isinstance(hvac, HvacStatus) else None
 
     def _get_realtime(self) -> Any | None:
-        return self.coordinator.data.get("realtime", {}).get(self._vin)
+        return self.coordinator.get_source_obj("realtime")
 
     @property
     def available(self) -> bool:
@@ -243,10 +252,7 @@ class BydSeatClimateSelect(CoordinatorEntity, SelectEntity):
             return False
         if self._vin not in self.coordinator.data.get("vehicles", {}):
             return False
-        return self._api.is_remote_command_supported(
-            self._vin,
-            f"seat_climate_{self.entity_description.key}",
-        )
+        return self._api.is_remote_command_supported(self._vin, self._command)
 
     @property
     def current_option(self) -> str | None:
@@ -286,7 +292,7 @@ class BydSeatClimateSelect(CoordinatorEntity, SelectEntity):
             await self._api.async_call(
                 _call,
                 vin=self._vin,
-                command=f"seat_climate_{self.entity_description.key}",
+                command=self._command,
             )
         except BydRemoteControlError as exc:
             _LOGGER.warning(
@@ -299,6 +305,7 @@ class BydSeatClimateSelect(CoordinatorEntity, SelectEntity):
             raise HomeAssistantError(str(exc)) from exc
 
         self._command_pending = True
+        self.coordinator.async_notify_next_refresh()
         self.async_write_ha_state()
 
     def _handle_coordinator_update(self) -> None:
@@ -309,20 +316,7 @@ class BydSeatClimateSelect(CoordinatorEntity, SelectEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        attrs: dict[str, Any] = {"vin": self._vin}
-        cmd = f"seat_climate_{self.entity_description.key}"
-        last_result = self._api.get_last_remote_result(self._vin, cmd)
-        if last_result:
-            attrs["last_remote_result"] = last_result
-        return attrs
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._vin)},
-            name=get_vehicle_display(self._vehicle),
-            manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
-            model=getattr(self._vehicle, "model_name", None),
-            serial_number=self._vin,
-            hw_version=getattr(self._vehicle, "tbox_version", None) or None,
-        )
+        last_result = self._api.get_last_remote_result(self._vin, self._command)
+        if not last_result:
+            return self._static_attrs
+        return {**self._static_attrs, "last_remote_result": last_result}
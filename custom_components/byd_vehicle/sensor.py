@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -17,6 +18,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
     EntityCategory,
+    Platform,
     UnitOfLength,
     UnitOfPressure,
     UnitOfSpeed,
@@ -24,6 +26,7 @@ from homeassistant.const import (
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -32,11 +35,12 @@ from pybyd.models.realtime import TirePressureUnit
 from .const import DOMAIN
 from .coordinator import (
     BydDataUpdateCoordinator,
-    get_vehicle_display,
 )
 
+_LOGGER = logging.getLogger(__name__)
 
-@dataclass(frozen=True, kw_only=True)
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class BydSensorDescription(SensorEntityDescription):
     """Describe a BYD sensor."""
 
@@ -692,6 +696,24 @@ SENSOR_DESCRIPTIONS: tuple[BydSensorDescription, ...] = (
 )
 
 
+def _group_by_source(
+    descriptions: tuple[BydSensorDescription, ...],
+) -> dict[str, tuple[BydSensorDescription, ...]]:
+    """Group sensor descriptions by their coordinator source in one pass."""
+    grouped: dict[str, list[BydSensorDescription]] = {}
+    for description in descriptions:
+        grouped.setdefault(description.source, []).append(description)
+    return {source: tuple(group) for source, group in grouped.items()}
+
+
+_DESCRIPTIONS_BY_SOURCE = _group_by_source(SENSOR_DESCRIPTIONS)
+
+
+def _sensor_unique_id(vin: str, description: BydSensorDescription) -> str:
+    """Return the unique id for a sensor description on a vehicle."""
+    return f"{vin}_{description.source}_{description.key}"
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -701,23 +723,53 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinators: dict[str, BydDataUpdateCoordinator] = data["coordinators"]
 
+    registry = er.async_get(hass)
     entities: list[SensorEntity] = []
     for vin, coordinator in coordinators.items():
         vehicle = coordinator.data.get("vehicles", {}).get(vin)
         if vehicle is None:
             continue
-        for description in SENSOR_DESCRIPTIONS:
-            entities.append(BydSensor(coordinator, vin, vehicle, description))
+        # Sources the vehicle returned nothing for (typically unsupported
+        # endpoints) only get entities that are already registered, so a
+        # transient failure never orphans an existing registry entry.
+        for source, descriptions in _DESCRIPTIONS_BY_SOURCE.items():
+            if coordinator.get_source_obj(source) is not None:
+                entities.extend(
+                    BydSensor(coordinator, vin, vehicle, description)
+                    for description in descriptions
+                )
+                continue
+            registered = [
+                description
+                for description in descriptions
+                if registry.async_get_entity_id(
+                    Platform.SENSOR, DOMAIN, _sensor_unique_id(vin, description)
+                )
+            ]
+            if len(registered) < len(descriptions):
+                _LOGGER.info(
+                    "Sensor setup skipped: vin=%s, source=%s, sensors=%s, "
+                    "reason=no_data (created after reload once data arrives)",
+                    vin[-6:],
+                    source,
+                    len(descriptions) - len(registered),
+                )
+            entities.extend(
+                BydSensor(coordinator, vin, vehicle, description)
+                for description in registered
+            )
 
     async_add_entities(entities)
 
 
-_TIRE_PRESSURE_KEYS = {
-    "left_front_tire_pressure",
-    "right_front_tire_pressure",
-    "left_rear_tire_pressure",
-    "right_rear_tire_pressure",
-}
+_TIRE_PRESSURE_KEYS = frozenset(
+    {
+        "left_front_tire_pressure",
+        "right_front_tire_pressure",
+        "left_rear_tire_pressure",
+        "right_rear_tire_pressure",
+    }
+)
 
 _TIRE_UNIT_MAP = {
     TirePressureUnit.BAR: UnitOfPressure.BAR,
@@ -745,7 +797,20 @@ class BydSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = description.name
         self._vin = vin
         self._vehicle = vehicle
-        self._attr_unique_id = f"{vin}_{description.source}_{description.key}"
+        self._attr_unique_id = _sensor_unique_id(vin, description)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, vin)},
+            name=coordinator.vehicle_display,
+            manufacturer=getattr(vehicle, "brand_name", None) or "BYD",
+            model=getattr(vehicle, "model_name", None),
+            serial_number=vin,
+            hw_version=getattr(vehicle, "tbox_version", None) or None,
+        )
+        # Only tire pressures have a unit that depends on the payload; every
+        # other sensor keeps the static unit from its description.
+        self._is_tire_pressure = description.key in _TIRE_PRESSURE_KEYS
+        if self._is_tire_pressure:
+            self._attr_native_unit_of_measurement = self._resolve_tire_unit()
 
         # Auto-disable sensors that return no data on first fetch.
         # If the description already disables the entity we leave it alone.
@@ -761,8 +826,7 @@ class BydSensor(CoordinatorEntity, SensorEntity):
 
     def _get_source_obj(self) -> Any | None:
         """Return the model object for this sensor's source."""
-        source_map = self.coordinator.data.get(self.entity_description.source, {})
-        return source_map.get(self._vin)
+        return self.coordinator.get_source_obj(self.entity_description.source)
 
     def _resolve_value(self) -> Any:
         """Extract the current value using the description's extraction logic."""
@@ -782,6 +846,22 @@ class BydSensor(CoordinatorEntity, SensorEntity):
             return enum_value
         return value
 
+    def _resolve_tire_unit(self) -> str | None:
+        """Return the tire pressure unit reported by the API."""
+        desc_unit = self.entity_description.native_unit_of_measurement
+        obj = self._get_source_obj()
+        if obj is not None:
+            api_unit = getattr(obj, "tire_press_unit", None)
+            if api_unit is not None:
+                return _TIRE_UNIT_MAP.get(api_unit, desc_unit)
+        return desc_unit
+
+    def _handle_coordinator_update(self) -> None:
+        """Re-resolve the tire pressure unit when fresh data arrives."""
+        if self._is_tire_pressure:
+            self._attr_native_unit_of_measurement = self._resolve_tire_unit()
+        super()._handle_coordinator_update()
+
     # ------------------------------------------------------------------
     # Entity properties
     # ------------------------------------------------------------------
@@ -800,32 +880,7 @@ class BydSensor(CoordinatorEntity, SensorEntity):
             )
         return super().available and self._get_source_obj() is not None
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the unit; tire pressures resolve dynamically."""
-        desc_unit = self.entity_description.native_unit_of_measurement
-        if self.entity_description.key not in _TIRE_PRESSURE_KEYS:
-            return desc_unit
-        obj = self._get_source_obj()
-        if obj is not None:
-            api_unit = getattr(obj, "tire_press_unit", None)
-            if api_unit is not None:
-                return _TIRE_UNIT_MAP.get(api_unit, desc_unit)
-        return desc_unit
-
     @property
     def native_value(self) -> Any:
         """Return the sensor value."""
         return self._resolve_value()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this sensor."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._vin)},
-            name=get_vehicle_display(self._vehicle),
-            manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
-            model=getattr(self._vehicle, "model_name", None),
-            serial_number=self._vin,
-            hw_version=getattr(self._vehicle, "tbox_version", None) or None,
-        )
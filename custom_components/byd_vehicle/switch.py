@@ -16,7 +16,7 @@ from pybyd import BydRemoteControlError
 from pybyd.models.hvac import HvacStatus
 
 from .const import DOMAIN
-from .coordinator import BydApi, BydDataUpdateCoordinator, get_vehicle_display
+from .coordinator import BydApi, BydDataUpdateCoordinator
 from .select import _gather_seat_climate_state
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,9 +37,9 @@ async def async_setup_entry(
         vehicle = coordinator.data.get("vehicles", {}).get(vin)
         if vehicle is None:
             continue
-        entities.append(BydCarOnSwitch(coordinator, api, vin, vehicle))
-        entities.append(BydBatteryHeatSwitch(coordinator, api, vin, vehicle))
-        entities.append(BydSteeringWheelHeatSwitch(coordinator, api, vin, vehicle))
+        entities.extend(
+            switch_cls(coordinator, api, vin, vehicle) for switch_cls in _SWITCH_TYPES
+        )
 
     async_add_entities(entities)
 
@@ -50,6 +50,7 @@ class BydBatteryHeatSwitch(CoordinatorEntity, SwitchEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "battery_heat"
     _attr_icon = "mdi:heat-wave"
+    _REMOTE_COMMANDS = ("battery_heat_on", "battery_heat_off")
 
     def __init__(
         self,
@@ -64,8 +65,17 @@ class BydBatteryHeatSwitch(CoordinatorEntity, SwitchEntity):
         self._vin = vin
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_switch_battery_heat"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, vin)},
+            name=coordinator.vehicle_display,
+            manufacturer=getattr(vehicle, "brand_name", None) or "BYD",
+            model=getattr(vehicle, "model_name", None),
+            serial_number=vin,
+            hw_version=getattr(vehicle, "tbox_version", None) or None,
+        )
         self._last_state: bool | None = None
         self._command_pending = False
+        self._static_attrs: dict[str, Any] = {"vin": vin}
 
     @property
     def available(self) -> bool:
@@ -81,8 +91,7 @@ class BydBatteryHeatSwitch(CoordinatorEntity, SwitchEntity):
         """Return whether battery heat is on."""
         if self._command_pending:
             return self._last_state
-        realtime_map = self.coordinator.data.get("realtime", {})
-        realtime = realtime_map.get(self._vin)
+        realtime = self.coordinator.get_source_obj("realtime")
         if realtime is not None:
             val = getattr(realtime, "battery_heat_state", None)
             if val is not None:
@@ -92,8 +101,7 @@ class BydBatteryHeatSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def assumed_state(self) -> bool:
         """Return True if we have no realtime data."""
-        realtime_map = self.coordinator.data.get("realtime", {})
-        realtime = realtime_map.get(self._vin)
+        realtime = self.coordinator.get_source_obj("realtime")
         if realtime is not None:
             return getattr(realtime, "battery_heat_state", None) is None
         return True
@@ -117,6 +125,7 @@ class BydBatteryHeatSwitch(CoordinatorEntity, SwitchEntity):
             self._last_state = None
             raise HomeAssistantError(str(exc)) from exc
         self._command_pending = True
+        self.coordinator.async_notify_next_refresh()
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -138,6 +147,7 @@ class BydBatteryHeatSwitch(CoordinatorEntity, SwitchEntity):
             self._last_state = None
             raise HomeAssistantError(str(exc)) from exc
         self._command_pending = True
+        self.coordinator.async_notify_next_refresh()
         self.async_write_ha_state()
 
     def _handle_coordinator_update(self) -> None:
@@ -148,25 +158,12 @@ class BydBatteryHeatSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        attrs: dict[str, Any] = {"vin": self._vin}
-        for cmd in ("battery_heat_on", "battery_heat_off"):
-            last_result = self._api.get_last_remote_result(self._vin, cmd)
-            if last_result:
-                attrs["last_remote_result"] = last_result
-                break
-        return attrs
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this switch."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._vin)},
-            name=get_vehicle_display(self._vehicle),
-            manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
-            model=getattr(self._vehicle, "model_name", None),
-            serial_number=self._vin,
-            hw_version=getattr(self._vehicle, "tbox_version", None) or None,
+        last_result = self._api.get_first_remote_result(
+            self._vin, self._REMOTE_COMMANDS
         )
+        if not last_result:
+            return self._static_attrs
+        return {**self._static_attrs, "last_remote_result": last_result}
 
 
 class BydCarOnSwitch(CoordinatorEntity, SwitchEntity):
@@ -175,6 +172,7 @@ class BydCarOnSwitch(CoordinatorEntity, SwitchEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "car_on"
     _attr_icon = "mdi:car"
+    _REMOTE_COMMANDS = ("car_on", "car_off")
     _TEMP_21C_SCALE = 7
 
     def __init__(
@@ -190,12 +188,23 @@ class BydCarOnSwitch(CoordinatorEntity, SwitchEntity):
         self._vin = vin
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_switch_car_on"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, vin)},
+            name=coordinator.vehicle_display,
+            manufacturer=getattr(vehicle, "brand_name", None) or "BYD",
+            model=getattr(vehicle, "model_name", None),
+            serial_number=vin,
+            hw_version=getattr(vehicle, "tbox_version", None) or None,
+        )
         self._last_state: bool | None = None
         self._command_pending = False
+        self._static_attrs: dict[str, Any] = {
+            "vin": vin,
+            "target_temperature_c": 21,
+        }
 
     def _get_hvac_status(self) -> HvacStatus | None:
-        hvac_map = self.coordinator.data.get("hvac", {})
-        hvac = hvac_map.get(self._vin)
+        hvac = self.coordinator.get_source_obj("hvac")
         return hvac if isinstance(hvac, HvacStatus) else None
 
     @property
@@ -243,6 +252,7 @@ class BydCarOnSwitch(CoordinatorEntity, SwitchEntity):
             self._last_state = None
             raise HomeAssistantError(str(exc)) from exc
         self._command_pending = True
+        self.coordinator.async_notify_next_refresh()
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -264,6 +274,7 @@ class BydCarOnSwitch(CoordinatorEntity, SwitchEntity):
             self._last_state = None
             raise HomeAssistantError(str(exc)) from exc
         self._command_pending = True
+        self.coordinator.async_notify_next_refresh()
         self.async_write_ha_state()
 
     def _handle_coordinator_update(self) -> None:
@@ -274,28 +285,12 @@ class BydCarOnSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        attrs: dict[str, Any] = {
-            "vin": self._vin,
-            "target_temperature_c": 21,
-        }
-        for cmd in ("car_on", "car_off"):
-            last_result = self._api.get_last_remote_result(self._vin, cmd)
-            if last_result:
-                attrs["last_remote_result"] = last_result
-                break
-        return attrs
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for this switch."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._vin)},
-            name=get_vehicle_display(self._vehicle),
-            manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
-            model=getattr(self._vehicle, "model_name", None),
-            serial_number=self._vin,
-            hw_version=getattr(self._vehicle, "tbox_version", None) or None,
+        last_result = self._api.get_first_remote_result(
+            self._vin, self._REMOTE_COMMANDS
         )
+        if not last_result:
+            return self._static_attrs
+        return {**self._static_attrs, "last_remote_result": last_result}
 
 
 class BydSteeringWheelHeatSwitch(CoordinatorEntity, SwitchEntity):
@@ -304,6 +299,7 @@ class BydSteeringWheelHeatSwitch(CoordinatorEntity, SwitchEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "steering_wheel_heat"
     _attr_icon = "mdi:steering"
+    _REMOTE_COMMANDS = ("steering_wheel_heat_on", "steering_wheel_heat_off")
 
     def __init__(
         self,
@@ -318,16 +314,24 @@ class BydSteeringWheelHeatSwitch(CoordinatorEntity, SwitchEntity):
         self._vin = vin
         self._vehicle = vehicle
         self._attr_unique_id = f"{vin}_switch_steering_wheel_heat"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, vin)},
+            name=coordinator.vehicle_display,
+            manufacturer=getattr(vehicle, "brand_name", None) or "BYD",
+            model=getattr(vehicle, "model_name", None),
+            serial_number=vin,
+            hw_version=getattr(vehicle, "tbox_version", None) or None,
+        )
         self._last_state: bool | None = None
         self._command_pending = False
+        self._static_attrs: dict[str, Any] = {"vin": vin}
 
     def _get_hvac_status(self) -> HvacStatus | None:
-        hvac_map = self.coordinator.data.get("hvac", {})
-        hvac = hvac_map.get(self._vin)
+        hvac = self.coordinator.get_source_obj("hvac")
         return hvac if isinstance(hvac, HvacStatus) else None
 
     def _get_realtime(self) -> Any | None:
-        return self.coordinator.data.get("realtime", {}).get(self._vin)
+        return self.coordinator.get_source_obj("realtime")
 
     @property
     def available(self) -> bool:
@@ -389,6 +393,7 @@ class BydSteeringWheelHeatSwitch(CoordinatorEntity, SwitchEntity):
             self._last_state = None
             raise HomeAssistantError(str(exc)) from exc
         self._command_pending = True
+        self.coordinator.async_notify_next_refresh()
         self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -406,21 +411,16 @@ class BydSteeringWheelHeatSwitch(CoordinatorEntity, SwitchEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        attrs: dict[str, Any] = {"vin": self._vin}
-        for cmd in ("steering_wheel_heat_on", "steering_wheel_heat_off"):
-            last_result = self._api.get_last_remote_result(self._vin, cmd)
-            if last_result:
-                attrs["last_remote_result"] = last_result
-                break
-        return attrs
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._vin)},
-            name=get_vehicle_display(self._vehicle),
-            manufacturer=getattr(self._vehicle, "brand_name", None) or "BYD",
-            model=getattr(self._vehicle, "model_name", None),
-            serial_number=self._vin,
-            hw_version=getattr(self._vehicle, "tbox_version", None) or None,
+        last_result = self._api.get_first_remote_result(
+            self._vin, self._REMOTE_COMMANDS
         )
+        if not last_result:
+            return self._static_attrs
+        return {**self._static_attrs, "last_remote_result": last_result}
+
+
+_SWITCH_TYPES = (
+    BydCarOnSwitch,
+    BydBatteryHeatSwitch,
+    BydSteeringWheelHeatSwitch,
+)